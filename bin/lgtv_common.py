@@ -14,24 +14,44 @@ Design notes (DO NOT REMOVE without understanding):
   or period of inactivity. Retrying 2-3 times with delays resolves this.
 - NEW CLIENT PER ATTEMPT: WebSocket connection closes after each operation.
   Cannot reuse LGTVClient instance - must create fresh one for retries.
+  Scripts running many operations in a row can use LGTVSession instead, which
+  keeps one connection open and reconnects once on transient errors.
 - SOCKET TIMEOUT: ws4py library has no connection timeout. After TV idle period,
-  connect() can hang for 15+ seconds. We set socket.setdefaulttimeout() before
-  connecting to fail fast and let retry logic handle it.
+  connect() can hang for 15+ seconds. We set a timeout on the client's own socket
+  (ws4py creates it in __init__, TLS wrapping inherits it) to fail fast and let
+  retry logic handle it. Never touch socket.setdefaulttimeout() - it is
+  process-global and leaks into unrelated sockets.
+- LAZY IMPORTS: ws4py, ssl and LGTV dominate import time but many invocations
+  never connect (e.g. held brightness key while another instance holds the
+  lock). They're imported on first LGTVClient creation instead.
 """
-import copy
+from __future__ import annotations
+
+import errno
+import functools
 import json
 import os
+import random
+import re
 import socket
-import ssl
 import subprocess
 import threading
 import time
 from contextlib import contextmanager
 from pathlib import Path
-from typing import Any, Callable
+from typing import TYPE_CHECKING, Any, Callable
+
+if TYPE_CHECKING:
+    import ssl
 
-from ws4py.client.threadedclient import WebSocketClient
-from LGTV.payload import hello_data
+# Optional faster JSON for WebSocket messages (orjson.dumps returns bytes, which ws4py sends as text)
+try:
+    import orjson
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:
+    _json_loads = json.loads
+    _json_dumps = json.dumps
 
 # =============================================================================
 # Configuration
@@ -41,48 +61,149 @@ CONFIG_PATH = Path.home() / ".config/lgtv/config.json"
 # Fallback TV names when multiple TVs configured
 FALLBACK_TV_NAMES = ["MyTV", "default", "LG TV"]
 
+# Parsed config keyed on (path, mtime_ns, size) - reparse only when file changes
+_CONFIG_CACHE: dict[tuple, dict] = {}
+
+# Resolved (LGTV_NAME, ip, key) as plain lines - skips JSON parsing entirely on
+# later invocations. Valid while newer than CONFIG_PATH; contains the key, so 0600.
+ENDPOINT_CACHE_PATH = Path.home() / ".cache/lgtv-endpoint"
+
 # =============================================================================
 # Timing constants
 # =============================================================================
-CONNECT_TIMEOUT = 2
-POLL_INTERVAL = 0.05
-SUBPROCESS_TIMEOUT = 5
+CONNECT_TIMEOUT = 2  # Upper bound on waiting for a TV response
+SEND_GRACE = 0.05  # Delay before closing after a fire-and-forget send
+SUBPROCESS_TIMEOUT = 5  # Max wait for a previous notify-send to print its ID
+
+# Adaptive response timeout: min(CONNECT_TIMEOUT, max(MIN, FACTOR * EWMA of observed
+# getter response times)). Most gets answer in <100ms, so a hung TV is retried much sooner.
+# Only getters opt in (adaptive_timeout=True): setters can legitimately take much longer
+# (e.g. pictureMode) and must not be re-sent because of a self-inflicted short deadline.
+# Registration always gets CONNECT_TIMEOUT. After any timeout, the rest of the process
+# waits the full CONNECT_TIMEOUT, so a TV waking from idle gets the baseline budget on retry.
+RTT_CACHE_PATH = Path.home() / ".cache/lgtv-rtt"
+RTT_EWMA_WEIGHT = 0.2  # Weight of newest sample
+RESPONSE_TIMEOUT_MIN = 0.25
+RESPONSE_TIMEOUT_FACTOR = 6
+_response_timed_out = False  # Set on first timeout; disables the short deadline
+# Error for a timeout hit only because of the short adaptive deadline - retried
+# silently (no "Reconnecting..." notification) since the TV may be healthy
+SHORT_DEADLINE_ERROR = "TV response timed out (short deadline)"  # Matches RETRYABLE_ERRORS
 
 # Retry settings for transient SSL errors (see module docstring for rationale)
 RETRY_ATTEMPTS = 3
-RETRY_DELAY = 0.5  # Multiplied by attempt number for increasing backoff
-SLOW_CONNECT_THRESHOLD = 1.0  # Show "Connecting..." notification after this delay
+RETRY_BASE_DELAY = 0.25  # Doubled each attempt (exponential backoff)
+RETRY_MAX_DELAY = 4.0
+RETRY_JITTER = 0.3  # +/- fraction, so scripts firing together (e.g. on resume) don't retry in lockstep
+SLOW_CONNECT_THRESHOLD = 1.0  # Show "Connecting..." notification when retrying past this delay
 
 # =============================================================================
 # Network
 # =============================================================================
 LGTV_SSL_PORT = 3001
 SOCKET_TIMEOUT = 3  # Timeout for socket connect (ws4py has no built-in timeout)
+# TCP probe before connecting. Just above the ~3s ARP timeout, so a powered-off
+# TV on the LAN reports EHOSTUNREACH instead of a bare probe timeout.
+PROBE_TIMEOUT = 3.5
 
 # Transient errors that warrant retry (see module docstring for rationale)
 RETRYABLE_ERRORS = ("SSL", "Connection", "EOF", "timed out")
+_RETRYABLE_RE = re.compile("|".join(map(re.escape, RETRYABLE_ERRORS)))
+
+# Auth/pairing errors - never retried, even if the text also matches RETRYABLE_ERRORS.
+# Regex patterns: status codes are anchored so digits inside SSL/errno text
+# (e.g. "(_ssl.c:1403)") or dotted addresses don't count.
+NON_RETRYABLE_ERRORS = (r"(?<![:.])\b403\b(?!\.\d)", r"not paired", r"unauthorized", r"KEY_NOT_RETURNED")
+_NON_RETRYABLE_RE = re.compile("|".join(NON_RETRYABLE_ERRORS), re.IGNORECASE)
+
+# Probe errors meaning the TV is off or unreachable - retrying won't help
+HOST_DOWN_ERRNOS = {errno.ECONNREFUSED, errno.EHOSTUNREACH, errno.ENETUNREACH}
 
 # Brightness cache - shared because picture-mode needs to invalidate it
 # when mode changes (each picture mode has its own brightness on LG TVs)
 BRIGHTNESS_CACHE_PATH = Path.home() / ".cache/lgtv-brightness"
+_brightness_invalidated = False  # Cache already deleted by this process
+
+# ID of this process's notification, reused so updates replace it (see notify())
+_notification_id: str | None = None
+_notification_proc: subprocess.Popen | None = None  # Last notify-send, ID not yet read
 
 
 # =============================================================================
 # Helper functions
 # =============================================================================
 def run_cmd(args: list[str]) -> None:
-    """Run subprocess with standard options (fire-and-forget, no output)."""
-    subprocess.run(args, capture_output=True, timeout=SUBPROCESS_TIMEOUT)
+    """Start subprocess fire-and-forget (no pipes, doesn't wait for it to finish)."""
+    subprocess.Popen(args, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                     start_new_session=True)
 
 
 def notify(title: str, message: str, urgency: str = "normal", timeout_ms: int = 2000,
            icon: str | None = None) -> None:
-    """Show desktop notification."""
-    args = ["notify-send", "-u", urgency, "-t", str(timeout_ms)]
+    """
+    Show desktop notification.
+
+    All notifications from one process update a single notification in place
+    (notify-send -p/-r), so "Connecting...", retry and result messages don't stack.
+    notify-send is not waited on; its printed ID is collected on the next call.
+    """
+    global _notification_id, _notification_proc
+    if _notification_proc is not None:
+        try:
+            output = _notification_proc.communicate(timeout=SUBPROCESS_TIMEOUT)[0].strip()
+            if output.isdigit():
+                _notification_id = output
+        except subprocess.TimeoutExpired:
+            pass
+        _notification_proc = None
+
+    args = ["notify-send", "-p", "-u", urgency, "-t", str(timeout_ms)]
+    if _notification_id:
+        args.extend(["-r", _notification_id])
     if icon:
         args.extend(["-i", icon])
     args.extend([title, message])
-    run_cmd(args)
+    _notification_proc = subprocess.Popen(args, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+                                          text=True, start_new_session=True)
+
+
+def _read_config() -> dict:
+    """Return parsed config.json, reusing the in-process copy if file is unchanged."""
+    st = CONFIG_PATH.stat()
+    cache_key = (str(CONFIG_PATH), st.st_mtime_ns, st.st_size)
+    config = _CONFIG_CACHE.get(cache_key)
+    if config is None:
+        with open(CONFIG_PATH) as f:
+            config = json.load(f)
+        _CONFIG_CACHE.clear()
+        _CONFIG_CACHE[cache_key] = config
+    return config
+
+
+def _read_endpoint_cache(tv_name: str, config_mtime_ns: int) -> tuple[str, str] | None:
+    """Return cached (ip, key) for tv_name if the cache is newer than config.json."""
+    try:
+        if ENDPOINT_CACHE_PATH.stat().st_mtime_ns <= config_mtime_ns:
+            return None
+        lines = ENDPOINT_CACHE_PATH.read_text().splitlines()
+    except OSError:
+        return None
+    if len(lines) != 3 or lines[0] != tv_name:
+        return None
+    return lines[1], lines[2]
+
+
+def _write_endpoint_cache(tv_name: str, ip: str, key: str) -> None:
+    """Atomically write resolved endpoint cache (tmp file + rename)."""
+    tmp_path = ENDPOINT_CACHE_PATH.with_name(f"{ENDPOINT_CACHE_PATH.name}.{os.getpid()}.tmp")
+    try:
+        ENDPOINT_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w") as f:
+            f.write(f"{tv_name}\n{ip}\n{key}\n")
+        os.replace(tmp_path, ENDPOINT_CACHE_PATH)
+    except OSError:
+        tmp_path.unlink(missing_ok=True)
 
 
 def load_config() -> tuple[str, str]:
@@ -90,7 +211,8 @@ def load_config() -> tuple[str, str]:
     Load TV IP and key from config.
 
     Uses LGTV_NAME env var if set, otherwise falls back to common TV names
-    or the first TV found in config.
+    or the first TV found in config. The resolved endpoint is cached in
+    ENDPOINT_CACHE_PATH so repeat invocations skip parsing config.json.
 
     Returns:
         Tuple of (ip, key) for the TV.
@@ -99,10 +221,12 @@ def load_config() -> tuple[str, str]:
         FileNotFoundError: If config file doesn't exist.
         KeyError: If specified TV not found or multiple TVs without LGTV_NAME.
     """
-    with open(CONFIG_PATH) as f:
-        config = json.load(f)
-
     tv_name = os.environ.get("LGTV_NAME")
+    cached = _read_endpoint_cache(tv_name or "", CONFIG_PATH.stat().st_mtime_ns)
+    if cached:
+        return cached
+
+    config = _read_config()
     if tv_name:
         if tv_name not in config:
             raise KeyError(f"TV '{tv_name}' not found in config")
@@ -118,12 +242,53 @@ def load_config() -> tuple[str, str]:
         else:
             raise KeyError(f"Multiple TVs found, set LGTV_NAME env var: {list(config.keys())}")
 
+    _write_endpoint_cache(tv_name or "", tv["ip"], tv["key"])
     return tv["ip"], tv["key"]
 
 
+def _load_rtt() -> float | None:
+    """Read smoothed TV response time from cache. Returns None if unknown."""
+    try:
+        return float(RTT_CACHE_PATH.read_text())
+    except (OSError, ValueError):
+        return None
+
+
+def _save_rtt(value: float) -> None:
+    """Write smoothed TV response time to cache."""
+    try:
+        RTT_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        RTT_CACHE_PATH.write_text(f"{value:.4f}")
+    except OSError:
+        pass
+
+
+def _response_timeout() -> float:
+    """How long to wait for a TV response, based on previously observed response times."""
+    if _response_timed_out:
+        return CONNECT_TIMEOUT
+    rtt = _load_rtt()
+    if rtt is None:
+        return CONNECT_TIMEOUT
+    return min(CONNECT_TIMEOUT, max(RESPONSE_TIMEOUT_MIN, RESPONSE_TIMEOUT_FACTOR * rtt))
+
+
+def _record_rtt(elapsed: float) -> None:
+    """Fold an observed response time into the cached EWMA."""
+    prev = _load_rtt()
+    _save_rtt(elapsed if prev is None else RTT_EWMA_WEIGHT * elapsed + (1 - RTT_EWMA_WEIGHT) * prev)
+
+
+def is_fatal(error: str | None) -> bool:
+    """Check if error is an auth/pairing failure that retrying can't fix."""
+    return error is not None and _NON_RETRYABLE_RE.search(str(error)) is not None
+
+
 def is_retryable(error: str | None) -> bool:
     """Check if error is transient and warrants retry."""
-    return error is not None and any(x in str(error) for x in RETRYABLE_ERRORS)
+    if error is None or is_fatal(error):
+        return False
+    return _RETRYABLE_RE.search(str(error)) is not None
 
 
 def invalidate_brightness_cache() -> None:
@@ -132,9 +297,15 @@ def invalidate_brightness_cache() -> None:
 
     Called by picture-mode script when mode changes, because each
     picture mode on LG TVs has its own brightness setting.
+    Skips the unlink syscall if this process already invalidated it - only
+    helps long-lived importers; one-shot scripts invalidate at most once.
     """
+    global _brightness_invalidated
+    if _brightness_invalidated:
+        return
     try:
         BRIGHTNESS_CACHE_PATH.unlink(missing_ok=True)
+        _brightness_invalidated = True
     except OSError:
         pass
 
@@ -167,137 +338,375 @@ def make_retry_notifier(title: str) -> Callable[[int], None]:
 # =============================================================================
 # WebSocket Client
 # =============================================================================
-class LGTVClient(WebSocketClient):
+# Byte substrings that any frame received_message() acts on must contain
+_RELEVANT_FRAME_MARKERS = (b'"id"', b'registered', b'error')
+
+@functools.cache
+def _ssl_context() -> ssl.SSLContext:
+    """
+    SSL context shared by all clients (built on first use).
+
+    LG TV uses self-signed certificate - must disable verification.
+    Applied by LGTVClient.connect(), since ws4py ignores ssl_options["context"].
+    """
+    import ssl
+    context = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
+    context.check_hostname = False
+    context.verify_mode = ssl.CERT_NONE
+    return context
+
+
+@functools.cache
+def _hello_template() -> str:
+    """
+    Registration template, frozen on first use.
+
+    hello_data is a mutable dict shared with the LGTV package - snapshotting it
+    means later in-process mutation can't corrupt our handshake.
+    """
+    from LGTV.payload import hello_data
+    return json.dumps(hello_data)
+
+
+@functools.lru_cache(maxsize=4)
+def _hello_payload(key: str) -> str:
+    """Serialized registration message for a client key (built once per key)."""
+    hello = json.loads(_hello_template())
+    hello["type"] = "register"
+    hello["payload"]["client-key"] = key
+    return json.dumps(hello)
+
+
+@functools.cache
+def _client_class() -> type[LGTVClient]:
+    """Combine LGTVClient with ws4py's WebSocketClient (imports ws4py on first use)."""
+    from ws4py.client.threadedclient import WebSocketClient
+    return type("LGTVClient", (LGTVClient, WebSocketClient), {"__module__": __name__})
+
+
+class LGTVClient:
     """
     WebSocket client for LG TV communication.
 
     Handles SSL setup, registration handshake, and command execution.
     Each instance is single-use - create a new one for each operation.
+    Independent commands can share one connection via execute_many().
+
+    Instantiating returns a subclass that also derives from ws4py's
+    WebSocketClient, so ws4py is only imported when a client is created.
     """
 
+    def __new__(cls, *args, **kwargs):
+        # Allocate the ws4py-backed subclass; Python then runs __init__ on it once
+        return super().__new__(_client_class() if cls is LGTVClient else cls)
+
     def __init__(self, ip: str, key: str):
         self._client_key = key
         self.result: dict | None = None
         self.error: str | None = None
-        self.command_done = False
-        self.pending_command: dict | None = None
-
-        # LG TV uses self-signed certificate - must disable verification
-        ssl_context = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
-        ssl_context.check_hostname = False
-        ssl_context.verify_mode = ssl.CERT_NONE
+        self._done = threading.Event()
+        self._sent = threading.Event()  # Commands sent (or error), for fire-and-forget
+        self._pending: dict[str, str | bytes] = {}  # command id -> serialized command
+        self._results: dict[str, dict] = {}  # command id -> response payload
+        self._adaptive_timeout = False  # Use the short adaptive deadline (getters only)
+        self._lock = threading.Lock()  # Guards _pending/_results/_done against the reader thread
 
         super().__init__(
             f'wss://{ip}:{LGTV_SSL_PORT}/',
             exclude_headers=["Origin"],
-            ssl_options={"context": ssl_context}
         )
+        # Plain socket is created by ws4py above; the SSL socket wrapped around it
+        # in connect() inherits this timeout for TCP connect and TLS handshake.
+        self.sock.settimeout(SOCKET_TIMEOUT)
+
+    def connect(self) -> None:
+        """
+        Wrap the socket with the shared SSL context, then run ws4py's connect().
+
+        ws4py builds a fresh SSLContext on every wss connect and never reads
+        ssl_options["context"]. Wrapping here and presenting the already-TLS
+        socket as plain "ws" makes ws4py skip its own wrapping.
+        """
+        self.sock = _ssl_context().wrap_socket(self.sock, server_hostname=self.host)
+        self._is_secure = True
+        self.scheme = "ws"
+        super().connect()
 
     def opened(self) -> None:
         """Send registration message when connection opens."""
-        hello = copy.deepcopy(hello_data)
-        hello["type"] = "register"
-        hello["payload"]["client-key"] = self._client_key
-        self.send(json.dumps(hello))
+        self.send(_hello_payload(self._client_key))
 
     def received_message(self, message) -> None:
         """Handle incoming WebSocket messages."""
-        data = json.loads(str(message))
-
-        if data.get("type") == "registered":
-            # Registration successful, send pending command if any
-            if self.pending_command:
-                self.send(json.dumps(self.pending_command))
-        elif data.get("type") == "response":
-            payload = data.get("payload", {})
-            if payload.get("returnValue") is False:
-                self.error = payload.get("errorText", "Unknown error")
-            else:
-                self.result = payload
-            self.command_done = True
-        elif data.get("type") == "error":
-            self.error = data.get("error", "Unknown error")
-            self.command_done = True
+        # ws4py messages hold raw bytes - parse them directly instead of decoding via str()
+        raw = message.data if hasattr(message, "data") else str(message).encode()
+        # Cheap peek: frames with no id that aren't registration/error can't be ours
+        if not any(marker in raw for marker in _RELEVANT_FRAME_MARKERS):
+            return
+        data = _json_loads(raw)
+
+        # Reader thread - hold the lock so send_and_wait() can't swap the
+        # pending command between our id check and recording the result
+        with self._lock:
+            if data.get("type") == "registered":
+                # Registration successful, send all pending commands
+                for pending in self._pending.values():
+                    self.send(pending)
+                self._sent.set()
+            elif data.get("type") == "response":
+                # Responses echo the command id - ignore ones we didn't send
+                msg_id = data.get("id")
+                if msg_id not in self._pending:
+                    return
+                payload = data.get("payload", {})
+                if payload.get("returnValue") is False:
+                    # Any failed command fails the whole batch
+                    self.error = payload.get("errorText", "Unknown error")
+                    self._done.set()
+                    return
+                self._results[msg_id] = payload
+                if len(self._results) == len(self._pending):
+                    self._done.set()
+            elif data.get("type") == "error":
+                # After registration, errors for ids we're not waiting on are stale
+                # (e.g. a late reply to an earlier session command)
+                if self._sent.is_set() and data.get("id") not in self._pending:
+                    return
+                self.error = data.get("error", "Unknown error")
+                self._done.set()
+                self._sent.set()
 
     def _wait_for_result(self) -> bool:
-        """Wait for command to complete. Returns True on success."""
-        start = time.time()
-        while not self.command_done and (time.time() - start) < CONNECT_TIMEOUT:
-            time.sleep(POLL_INTERVAL)
-        return self.command_done and self.error is None
+        """
+        Wait for command to complete. Returns True on success.
+
+        Blocks on an Event set from ws4py's reader thread, so we return as soon
+        as the TV replies instead of polling. For getters the response timeout
+        adapts to observed response times (measured from send, so registration
+        isn't counted); a timeout counts as the deadline so slow TVs grow their budget.
+        """
+        global _response_timed_out
+        if not self._wait_for_registration():
+            return False
+        deadline = _response_timeout() if self._adaptive_timeout else CONNECT_TIMEOUT
+        start = time.monotonic()
+        if not self._done.wait(deadline):
+            _response_timed_out = True
+            if deadline < CONNECT_TIMEOUT:
+                _record_rtt(deadline)
+                self.error = SHORT_DEADLINE_ERROR
+            else:
+                self.error = "TV response timed out"  # Matches RETRYABLE_ERRORS
+            return False
+        if self._adaptive_timeout:
+            _record_rtt(time.monotonic() - start)
+        return self.error is None
+
+    def _wait_for_registration(self) -> bool:
+        """Wait until registered and pending commands were sent. Returns True on success."""
+        if not self._sent.wait(CONNECT_TIMEOUT):
+            self.error = "TV registration timed out"  # Matches RETRYABLE_ERRORS
+            return False
+        return self.error is None
+
+    def _wait_for_sent(self) -> bool:
+        """Wait until registration completed and commands were sent. Returns True on success."""
+        if not self._wait_for_registration():
+            return False
+        time.sleep(SEND_GRACE)  # Let the frames reach the wire before close()
+        return True
+
+    def command_id(self, prefix: str) -> str:
+        """Id for a command sent by this client (single-use, so ids needn't be unique)."""
+        return f"{prefix}_1"
+
+    def execute_many(self, commands: list[dict]) -> dict[str, dict] | None:
+        """
+        Execute several commands over a single connection.
+
+        All commands are sent after registration and responses are matched
+        by id, so N commands cost one connect/TLS/register handshake.
+
+        Args:
+            commands: Command dicts to send. Each must have a unique "id".
+
+        Returns:
+            Dict mapping command id to response payload on success, None if
+            any command fails. Check self.error for error details on failure.
+        """
+        return self._execute_serialized({command["id"]: _json_dumps(command) for command in commands})
+
+    def execute_raw(self, command_id: str, message: str | bytes,
+                    wait_for_response: bool = True, adaptive_timeout: bool = False) -> dict | None:
+        """
+        Execute an already-serialized command on the TV.
+
+        Args:
+            command_id: The "id" field inside message (used to match the response).
+            message: JSON-encoded command, sent as-is.
+            wait_for_response: If False, return {} once the command is sent
+                               instead of waiting for the TV's acknowledgment.
+            adaptive_timeout: Wait with the short adaptive deadline instead of
+                              CONNECT_TIMEOUT. Only for side-effect-free getters.
+
+        Returns:
+            The response payload dict on success, None on failure.
+            Check self.error for error details on failure.
+        """
+        self._adaptive_timeout = adaptive_timeout
+        results = self._execute_serialized({command_id: message}, wait_for_response)
+        if results is None:
+            return None
+        self.result = results.get(command_id, {})
+        return self.result
+
+    def _execute_serialized(self, messages: dict[str, str | bytes],
+                            wait_for_response: bool = True) -> dict[str, dict] | None:
+        """Connect, send messages (id -> JSON) after registration, and wait for all responses."""
+        self._pending = messages
+        try:
+            with self._connection():
+                if not wait_for_response:
+                    return self._results if self._wait_for_sent() else None
+                if self._wait_for_result():
+                    return self._results
+        except Exception as e:
+            self.error = str(e)
+        return None
+
+    def connect_and_register(self) -> bool:
+        """
+        Open a persistent connection and register, sending no commands.
+
+        Used by LGTVSession; follow with send_and_wait() for each command.
+        Returns True on success, check self.error on failure.
+        """
+        self._pending = {}
+        try:
+            self.connect()
+        except Exception as e:
+            self.error = str(e)
+            return False
+        return self._wait_for_registration()
+
+    def send_and_wait(self, command_id: str, message: str | bytes,
+                      wait_for_response: bool = True, adaptive_timeout: bool = False) -> dict | None:
+        """
+        Send a serialized command on a connection opened by connect_and_register().
+
+        Returns the response payload dict ({} if not waiting) on success, None on failure.
+        See execute_raw() for the flags.
+        """
+        self._adaptive_timeout = adaptive_timeout
+        with self._lock:
+            self._pending = {command_id: message}
+            self._results = {}
+            self._done.clear()
+            self.error = None
+        try:
+            self.send(message)
+        except Exception as e:
+            self.error = str(e)
+            return None
+        if not wait_for_response:
+            return {}
+        if not self._wait_for_result():
+            return None
+        self.result = self._results.get(command_id)
+        return self.result
 
     @contextmanager
     def _connection(self):
         """
-        Context manager for TV connection with socket timeout.
+        Context manager for TV connection with cleanup.
 
-        Handles socket timeout setup/restore and cleanup. ws4py has no built-in
-        connection timeout, so we use socket.setdefaulttimeout() to prevent
-        hanging when TV is idle (see module docstring).
+        Socket timeout is already set on self.sock in __init__ (see module
+        docstring), so connect() fails fast when TV is idle.
         """
-        old_timeout = socket.getdefaulttimeout()
         try:
-            socket.setdefaulttimeout(SOCKET_TIMEOUT)
             self.connect()
             yield
         finally:
-            socket.setdefaulttimeout(old_timeout)
             try:
                 self.close()
             except Exception:
                 pass
 
-    def execute(self, command: dict) -> dict | None:
+    def execute(self, command: dict, wait_for_response: bool = True) -> dict | None:
         """
         Execute a command on the TV.
 
         Args:
             command: The command dict to send (type, id, uri, payload).
+            wait_for_response: If False, return {} once the command is sent
+                               instead of waiting for the TV's acknowledgment.
 
         Returns:
             The response payload dict on success, None on failure.
             Check self.error for error details on failure.
         """
-        self.pending_command = command
-        try:
-            with self._connection():
-                if self._wait_for_result():
-                    return self.result
-        except Exception as e:
-            self.error = str(e)
-        return None
+        return self.execute_raw(command["id"], _json_dumps(command), wait_for_response)
 
 
 # =============================================================================
 # TV Settings Helpers
 # =============================================================================
-def get_system_setting(client: LGTVClient, category: str, key: str) -> Any:
+# Preformatted requests - only the variable parts are JSON-encoded per call
+# Command ids come from client.command_id() so sessions get a unique id per command
+_GET_SETTING_TEMPLATE = (
+    '{{"type":"request","id":"{command_id}","uri":"ssap://settings/getSystemSettings",'
+    '"payload":{{"category":{category},"keys":[{key}]}}}}'
+)
+_SET_SETTING_TEMPLATE = (
+    '{{"type":"request","id":"{command_id}","uri":"ssap://settings/setSystemSettings",'
+    '"payload":{{"category":{category},"settings":{settings}}}}}'
+)
+
+
+def get_system_setting(client: LGTVClient | LGTVSession, category: str, key: str) -> Any:
     """Get a single system setting from the TV. Returns the value or None."""
-    result = client.execute({
-        "type": "request",
-        "id": "get_1",
-        "uri": "ssap://settings/getSystemSettings",
-        "payload": {"category": category, "keys": [key]}
-    })
+    command_id = client.command_id("get")
+    result = client.execute_raw(command_id, _GET_SETTING_TEMPLATE.format(
+        command_id=command_id, category=json.dumps(category), key=json.dumps(key)),
+        adaptive_timeout=True)
     if result:
         return result.get("settings", {}).get(key)
     return None
 
 
-def set_system_setting(client: LGTVClient, category: str, **settings) -> bool:
-    """Set system settings on the TV. Returns True on success."""
-    result = client.execute({
-        "type": "request",
-        "id": "set_1",
-        "uri": "ssap://settings/setSystemSettings",
-        "payload": {"category": category, "settings": settings}
-    })
+def set_system_setting(client: LGTVClient | LGTVSession, category: str, wait_for_response: bool = True,
+                       **settings) -> bool:
+    """
+    Set system settings on the TV. Returns True on success.
+
+    With wait_for_response=False, success only means the request was sent -
+    use when the caller doesn't need the TV's confirmation.
+    """
+    command_id = client.command_id("set")
+    result = client.execute_raw(command_id, _SET_SETTING_TEMPLATE.format(
+        command_id=command_id, category=json.dumps(category), settings=json.dumps(settings)),
+        wait_for_response)
     return result is not None
 
 
 # =============================================================================
 # Retry Logic
 # =============================================================================
+def _probe(ip: str) -> OSError | None:
+    """Open and close a plain TCP connection to the TV. Returns the error, if any."""
+    try:
+        socket.create_connection((ip, LGTV_SSL_PORT), timeout=PROBE_TIMEOUT).close()
+        return None
+    except OSError as e:
+        return e
+
+
+def _retry_delay(attempt: int) -> float:
+    """Exponential backoff with jitter for the given (zero-based) attempt."""
+    delay = min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * (2 ** attempt))
+    return delay * (1 + random.uniform(-RETRY_JITTER, RETRY_JITTER))
+
+
 def with_retry(
     ip: str,
     key: str,
@@ -324,26 +733,29 @@ def with_retry(
     Returns:
         Result from operation, or None/False on failure.
     """
-    last_error = None
-
-    # Show "Connecting..." if first attempt takes longer than threshold.
-    # Uses a timer thread because connect() is a blocking call.
-    # When it fires, we skip per-retry notifications to avoid notification spam.
-    slow_notified = threading.Event()
+    # Fail fast when the TV is powered off - otherwise every attempt would
+    # go through SSL setup and block on connect() before giving up.
+    # Only definite host-down errnos skip retries. A probe timeout falls through
+    # to the retry loop: a waking TV or Wi-Fi in power-save may just be slow.
+    probe_error = _probe(ip)
+    if probe_error is not None and probe_error.errno in HOST_DOWN_ERRNOS:
+        notify(notification_title, f"TV unreachable: {probe_error.strerror}", "critical")
+        return None
 
-    def _slow_notify():
-        slow_notified.set()
-        notify(notification_title, "Connecting to TV...", "low", 1500)
+    last_error = None
 
-    slow_timer = threading.Timer(SLOW_CONNECT_THRESHOLD, _slow_notify)
-    slow_timer.start()
+    # Show "Connecting..." once if we're still retrying past the threshold.
+    # Checked inline between attempts rather than with a timer thread, so fast
+    # operations (the common hotkey case) never spawn a thread.
+    # Once shown, we skip per-retry notifications to avoid notification spam.
+    start = time.monotonic()
+    slow_notified = False
 
     for attempt in range(RETRY_ATTEMPTS):
         client = LGTVClient(ip, key)  # Fresh client required - connection is one-shot
         result = operation(client)
 
         if result is not None and result is not False:
-            slow_timer.cancel()
             return result
 
         last_error = client.error
@@ -352,10 +764,115 @@ def with_retry(
             break
 
         if attempt < RETRY_ATTEMPTS - 1:
-            if on_retry and not slow_notified.is_set():
+            if not slow_notified and time.monotonic() - start >= SLOW_CONNECT_THRESHOLD:
+                notify(notification_title, "Connecting to TV...", "low", 1500)
+                slow_notified = True
+            elif on_retry and not slow_notified and last_error != SHORT_DEADLINE_ERROR:
                 on_retry(attempt + 1)
-            time.sleep(RETRY_DELAY * (attempt + 1))  # Increasing delay between retries
+            time.sleep(_retry_delay(attempt))
 
-    slow_timer.cancel()
+    if is_fatal(last_error):
+        last_error = f"{last_error} (re-pair with omarchy-install-lgtv)"
     notify(notification_title, last_error or error_msg, "critical")
     return result
+
+
+# =============================================================================
+# Persistent Session
+# =============================================================================
+class LGTVSession:
+    """
+    One TV connection reused across several operations.
+
+    For scripts that run many operations in sequence (e.g. a brightness ramp),
+    this pays the TLS + register handshake once instead of per operation.
+    A dropped connection is detected before each command and re-established;
+    a transient error mid-command reconnects and retries once.
+    Supports execute()/execute_raw() like LGTVClient, so the settings helpers
+    accept a session too. One-shot callers should keep using with_retry().
+
+    Usage:
+        with LGTVSession(ip, key) as session:
+            for value in range(40, 60):
+                set_system_setting(session, "picture", backlight=value)
+    """
+
+    def __init__(self, ip: str, key: str):
+        self._ip = ip
+        self._key = key
+        self._client: LGTVClient | None = None
+        self._command_count = 0
+        self.error: str | None = None
+
+    def __enter__(self) -> LGTVSession:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the underlying connection, if open."""
+        if self._client is not None:
+            try:
+                self._client.close()
+            except Exception:
+                pass
+            self._client = None
+
+    def _live_client(self) -> LGTVClient | None:
+        """Return the open client, reconnecting if ws4py has terminated it."""
+        if self._client is not None and not self._client.terminated:
+            return self._client
+        self.close()
+        client = LGTVClient(self._ip, self._key)
+        if not client.connect_and_register():
+            self.error = client.error
+            try:
+                client.close()
+            except Exception:
+                pass
+            return None
+        self._client = client
+        return client
+
+    def command_id(self, prefix: str) -> str:
+        """
+        Unique id for the next command in this session.
+
+        Responses are matched by id, so reusing one (e.g. "get_1" for every get)
+        would let a late reply to an earlier command satisfy a later one.
+        """
+        self._command_count += 1
+        return f"{prefix}_{self._command_count}"
+
+    def execute_raw(self, command_id: str, message: str | bytes,
+                    wait_for_response: bool = True, adaptive_timeout: bool = False) -> dict | None:
+        """
+        Execute an already-serialized command over the session's connection.
+
+        command_id must come from command_id() so it is unique in this session.
+        See LGTVClient.execute_raw() for the flags.
+
+        Returns the response payload dict on success, None on failure.
+        Check self.error for error details on failure.
+        """
+        for attempt in range(2):
+            client = self._live_client()
+            if client is not None:
+                result = client.send_and_wait(command_id, message, wait_for_response, adaptive_timeout)
+                if result is not None:
+                    return result
+                self.error = client.error
+            if attempt or not is_retryable(self.error):
+                break
+            self.close()  # Drop the broken connection and reconnect once
+        return None
+
+    def execute(self, command: dict, wait_for_response: bool = True) -> dict | None:
+        """
+        Execute a command dict over the session's connection. See execute_raw().
+
+        The command's id is used as a prefix for a unique per-session id.
+        """
+        command = {**command, "id": self.command_id(command["id"])}
+        return self.execute_raw(command["id"], _json_dumps(command), wait_for_response)